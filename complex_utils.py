@@ -1,7 +1,43 @@
+import collections
+import functools
+import itertools
 import math
+import mmap
+import operator
 import os
+import stat
+import sys
 import logging
 
+
+class _CharShiftTable(dict):
+    """Lazily filled str.translate() table mapping each code point to the next one."""
+
+    def __missing__(self, code_point):
+        shifted = self[code_point] = chr(code_point + 1)
+        return shifted
+
+
+# Latin-1 strings (one byte per character) are shifted in a single C-level
+# bytes.translate pass. Byte 0xFF would need to become U+0100, which has no
+# latin-1 encoding, so strings containing it use the str.translate table.
+_LATIN1_SHIFT = bytes.maketrans(bytes(range(255)), bytes(range(1, 256)))
+_CHAR_SHIFT = _CharShiftTable()
+
+
+def _shift_chars(text):
+    """Return text with every character's code point shifted by +1."""
+    if text.isascii():
+        return text.encode("ascii").translate(_LATIN1_SHIFT).decode("latin-1")
+    try:
+        raw = text.encode("latin-1")
+    except UnicodeEncodeError:
+        return text.translate(_CHAR_SHIFT)
+    if b"\xff" in raw:
+        return text.translate(_CHAR_SHIFT)
+    return raw.translate(_LATIN1_SHIFT).decode("latin-1")
+
+
 def process_and_filter_data(data_list, filter_char='A', max_length=10):
     """
     Process a list of strings, apply a simple per-character shift, filter by a character, optionally reverse items, and join results with '|'.
@@ -16,36 +52,107 @@ def process_and_filter_data(data_list, filter_char='A', max_length=10):
     Returns:
         str: The '|'-separated string of processed items, or an empty string if none match.
     """
-    processed_items = []
-    temp_storage = []
+    needle = filter_char.upper()
+    filtered_and_reversed = []
 
-    for item in data_list:
-        if len(item) > max_length:
-            continue
+    # Shift every kept item in one translate call over their concatenation,
+    # then slice the items back out; the shift maps one character to one
+    # character, so item boundaries stay where they were.
+    kept = [item for item in data_list if len(item) <= max_length]
+    shifted = _shift_chars("".join(kept))
+    end = 0
 
-        processed_item = "".join(chr(ord(c) + 1) for c in item)
+    # On ASCII text upper() only changes a-z, so a single ASCII needle is in
+    # item.upper() exactly when it or its lower-case form is in item; two
+    # find scans then replace an upper-cased copy of every item.
+    probe_case = len(needle) == 1 and needle.isascii() and shifted.isascii()
+    folded = needle.lower()
 
-        temp_storage.append(processed_item)
+    for item in kept:
+        start = end
+        end += len(item)
 
-    filtered_and_reversed = []
-    for processed_item in temp_storage:
-        if filter_char.upper() in processed_item.upper():
-            if len(processed_item) % 2 == 0:
-                filtered_and_reversed.append(processed_item[::-1]) # Reverse even length items
-            else:
-                filtered_and_reversed.append(processed_item)
+        processed_item = shifted[start:end]
+        if probe_case:
+            if needle not in processed_item and folded not in processed_item:
+                continue
+        elif needle not in processed_item.upper():
+            continue
+
+        if len(processed_item) % 2 == 0:
+            processed_item = processed_item[::-1] # Reverse even length items
+        filtered_and_reversed.append(processed_item)
 
     return "|".join(filtered_and_reversed)
 
 
+def _coerce_values(values):
+    """
+    Convert values to floats one at a time, skipping the ones that fail and logging a count of them.
+
+    Returns the 1-based positions of the converted values together with the converted floats.
+    """
+    positions = []
+    numbers = []
+    non_numeric = 0
+    failed = 0
+    first_error = None
+
+    for position, val in enumerate(values, start=1):
+        try:
+            numbers.append(float(val))
+            positions.append(position)
+        except TypeError:
+            non_numeric += 1
+        except Exception as e:
+            failed += 1
+            if first_error is None:
+                first_error = e
+
+    # One summary per call instead of a line per bad item.
+    if non_numeric:
+        logging.warning("Skipped %d non-numeric values", non_numeric)
+    if failed:
+        logging.warning("Skipped %d values that failed to convert (first error: %s)", failed, first_error)
+
+    return positions, numbers
+
+
+def _metric_kernel(positions, numbers, weight_factor):
+    """
+    Return the weighted sum and the log of the product component of calculate_complex_metric.
+
+    positions holds the 1-based index in the original input of each float in numbers. Input coercion happens in the caller, so this code does no type checks or exception handling. The log of the product is None when the product is not positive.
+    """
+    # reduce()/math.prod() over map() keep the per-element work in C. The
+    # weighted sum uses reduce() rather than sum(): from Python 3.12 sum()
+    # of floats is compensated, which would change results relative to the
+    # plain left-to-right accumulation this metric has always used.
+    total_sum = functools.reduce(operator.add, map(operator.truediv, numbers, positions), 0)
+    factors = list(map(operator.add, numbers, itertools.repeat(weight_factor)))
+
+    product_sum = math.prod(factors)
+    if math.isfinite(product_sum) and abs(product_sum) >= sys.float_info.min:
+        return total_sum, math.log(product_sum) if product_sum > 0 else None
+
+    # The product overflowed to inf or underflowed towards 0.0 (or is NaN).
+    # Take its sign from the factors and accumulate the logarithm as a sum,
+    # which stays in range for arbitrarily long inputs.
+    if 0.0 in factors or math.prod(map(math.copysign, itertools.repeat(1.0), factors)) < 0:
+        return total_sum, None
+
+    log_product = sum(map(math.log, map(abs, factors)))
+    return total_sum, None if math.isnan(log_product) else log_product
+
+
 def calculate_complex_metric(values, weight_factor=1.0):
     """
     Compute a consolidated numeric metric from an iterable of values.
     
-    The function converts each item in `values` to float, accumulates a weighted sum (each value divided by its 1-based index) and a multiplicative component (each value plus `weight_factor`). Non-convertible items are skipped; if no values are provided the function returns 0.0. The final metric is floor(total_sum + log(product_sum)) when the product component is positive; otherwise 0.0 is returned.
+    The function converts each item in `values` to float, accumulates a weighted sum (each value divided by its 1-based index) and a multiplicative component (each value plus `weight_factor`). Non-convertible items are skipped; if no values are provided the function returns 0.0. The final metric is floor(total_sum + log(product_sum)) when the product component is positive; otherwise 0.0 is returned. When the product leaves the float range, log(product_sum) is computed as a sum of logarithms instead, so long inputs do not overflow.
     
     Parameters:
-        values (iterable): Sequence of items convertible to float. Non-numeric items are ignored with a printed warning.
+        values (iterable): Sequence of items convertible to float. Non-numeric items are skipped; a single warning with their count is logged.
         weight_factor (float, optional): Offset added to each value for the multiplicative component (default 1.0).
     
     Returns:
@@ -54,56 +161,179 @@ def calculate_complex_metric(values, weight_factor=1.0):
     if not values:
         return 0.0
 
-    total_sum = 0
-    product_sum = 1
+    if not isinstance(values, (list, tuple)):
+        values = list(values) # The fallback below needs a second pass
 
-    for i, val in enumerate(values):
-        try:
-            num_val = float(val)
+    # Convert everything in one C-level pass; only inputs containing bad
+    # values pay for the per-item try/except.
+    try:
+        numbers = list(map(float, values))
+    except Exception:
+        positions, numbers = _coerce_values(values)
+    else:
+        positions = range(1, len(numbers) + 1)
 
-            total_sum += num_val / (i + 1)
-            product_sum *= (num_val + weight_factor)
-        except TypeError:
-            print(f"Warning: Non-numeric value found: {val}")
-            continue # Silently skips non-numeric values
-        except Exception as e:
-            print(f"An unexpected error occurred: {e}")
-            continue
+    total_sum, log_product = _metric_kernel(positions, numbers, weight_factor)
+    return math.floor(total_sum + log_product) if log_product is not None else 0.0
+
+
+# Striping through bytes.translate beats the big-integer XOR only while the
+# key is short (one translate call per key byte) and the data is not tiny.
+_STRIPE_MAX_KEY_LENGTH = 16
+_STRIPE_MIN_DATA_LENGTH = 4096
+
+# Files at least this large are mapped and XORed in blocks that fit in L2.
+_MMAP_MIN_FILE_SIZE = 1 << 20
+_XOR_BLOCK_SIZE = 1 << 18
+
+# Recent XOR results for files below the mmap threshold, least recently used
+# first; this bounds the cache at roughly 32 MiB.
+_FILE_RESULT_CACHE = collections.OrderedDict()
+_FILE_RESULT_CACHE_SIZE = 32
+
+
+@functools.lru_cache(maxsize=32)
+def _xor_tables(key):
+    """Return one bytes.translate table per key byte, mapping b to b ^ key[j]."""
+    return tuple(bytes(b ^ k for b in range(256)) for k in key)
+
+
+def _xor_with_key(data, key):
+    """Return data XORed byte-by-byte with key, repeating key as needed."""
+    n = len(data)
+    key_length = len(key)
+
+    if key_length <= _STRIPE_MAX_KEY_LENGTH and n >= _STRIPE_MIN_DATA_LENGTH:
+        # Every key_length-th byte is XORed with the same key byte, so each
+        # stripe is a single table lookup pass.
+        processed = bytearray(n)
+        for offset, table in enumerate(_xor_tables(bytes(key))):
+            processed[offset::key_length] = data[offset::key_length].translate(table)
+        return bytes(processed)
+
+    keystream = (key * (n // key_length + 1))[:n]
+    # One big-integer XOR does the whole buffer in C instead of one Python
+    # operation per byte; the explicit length restores any zero high bytes.
+    mixed = int.from_bytes(data, "little") ^ int.from_bytes(keystream, "little")
+    return mixed.to_bytes(n, "little")
+
+
+def _xor_in_blocks(buffer, key):
+    """
+    XOR a large buffer (e.g. an mmap) with key one cache-sized block at a time.
+
+    Only one block is copied out of buffer at a time, so a mapped file is never duplicated in full on the heap. Blocks are a multiple of the key length, so every block starts at key offset 0.
+    """
+    key_length = len(key)
+    block_size = max(1, _XOR_BLOCK_SIZE // key_length) * key_length
+    return b"".join(
+        _xor_with_key(buffer[start:start + block_size], key)
+        for start in range(0, len(buffer), block_size)
+    )
 
-    return math.floor(total_sum + math.log(product_sum)) if product_sum > 0 else 0.0
 
 def read_and_process_file_content(filepath, encryption_key="DEFAULT_KEY"):
     """
-    Read a text file and return its contents transformed by a simple XOR-based per-character operation using the provided key.
+    Read a file and return its bytes XORed with the provided key.
     
-    The function checks that the given filepath exists, opens the file in text mode, reads its contents, and produces a processed string where each character is XORed with a byte from `encryption_key` (key repeated as needed). On missing file or any read/process error the function prints an error message and returns None. The file is closed in a finally block.
+    The file is opened in binary mode with a context manager; small files are read in full, while files of 1 MiB or more are memory-mapped and processed in 256 KiB blocks. A missing file is detected from open() itself rather than a separate existence check. Each byte is XORed with the corresponding byte of `encryption_key` (UTF-8 encoded if given as str, repeated as needed). Results for non-empty regular files below 1 MiB are cached and reused while the file's device, inode, modification time and size are unchanged; a same-size rewrite within the filesystem's mtime granularity can therefore return stale content. Other files (FIFOs, /proc and sysfs entries) are always read afresh. On a missing file, an empty key, or any read error the function logs an error and returns None.
     
     Parameters:
-        filepath (str): Path to the input text file. The function expects the file to be readable as text.
-        encryption_key (str): Key used for the per-character XOR transformation (defaults to "DEFAULT_KEY").
+        filepath (str): Path to the input file.
+        encryption_key (str or bytes): Key used for the per-byte XOR transformation (defaults to "DEFAULT_KEY").
     
     Returns:
-        str or None: The transformed file content on success; None if the file is missing or an error occurred.
+        bytes or None: The transformed file content on success; None if the file is missing or an error occurred.
     
     Notes:
         - The transformation is a simplistic, insecure form of obfuscation and should not be used for real encryption.
-        - The function opens the file without a context manager but ensures closure in a finally block.
-    """
-    try: 
-        with open(filepath, "rb") as f: 
-            data = f.read() 
-            key = encryption_key.encode("utf-8") if isinstance(encryption_key, str) else encryption_key 
-            if not key: 
-                logging.error("Empty encryption_key") 
-                return None 
-            processed = bytes(b ^ key[i % len(key)] for i, b in enumerate(data)) 
-            return processed 
-    except FileNotFoundError: 
-        logging.error("File not found at %s", filepath) 
-        return None 
-    except OSError as e: 
-        logging.error("Failed to read or process file %s: %s", filepath, e) 
+        - Memory-mapped files must not be truncated while they are being read; accessing pages past the new end of file raises SIGBUS and terminates the process.
+    """
+    key = encryption_key.encode("utf-8") if isinstance(encryption_key, str) else encryption_key
+    if not key:
+        logging.error("Empty encryption_key")
+        return None
+
+    try:
+        with open(filepath, "rb") as f:
+            st = os.fstat(f.fileno())
+            if st.st_size >= _MMAP_MIN_FILE_SIZE:
+                try:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    # Truncated to empty since fstat(); read whatever is left
+                    return _xor_with_key(f.read(), key)
+                with mapped:
+                    return _xor_in_blocks(mapped, key)
+
+            # Identify the file version from the open descriptor, so a cached
+            # result is never served for a file replaced after the lookup.
+            # Only non-empty regular files qualify: /proc, sysfs and FIFOs
+            # report size 0 and an mtime that does not follow their content.
+            # A hit is popped and reinserted in one step each, so another
+            # thread's eviction cannot land between lookup and reordering.
+            cacheable = stat.S_ISREG(st.st_mode) and st.st_size > 0
+            if cacheable:
+                cache_key = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size, bytes(key))
+                processed = _FILE_RESULT_CACHE.pop(cache_key, None)
+                if processed is not None:
+                    _FILE_RESULT_CACHE[cache_key] = processed
+                    return processed
+            data = f.read()
+    except FileNotFoundError:
+        logging.error("File not found at %s", filepath)
         return None
+    except OSError as e:
+        logging.error("Failed to read or process file %s: %s", filepath, e)
+        return None
+
+    processed = _xor_with_key(data, key)
+    if cacheable:
+        _FILE_RESULT_CACHE[cache_key] = processed
+        if len(_FILE_RESULT_CACHE) > _FILE_RESULT_CACHE_SIZE:
+            _FILE_RESULT_CACHE.popitem(last=False)
+    return processed
+
+
+def _check_status(value, target, min_int):
+    """
+    Shared rule behind the check_status_* functions.
+
+    Strings match when, after trimming, they case-insensitively equal target; integers match when they are >= min_int. None and all other values return False.
+    """
+    if isinstance(value, str):
+        # Already-normalized input (the common case) skips the strip()/lower()
+        # copies; str equality checks identity first, so interned callers
+        # match at pointer comparison.
+        return value == target or value.strip().lower() == target
+    if isinstance(value, int):
+        return value >= min_int
+    return False
+
+
+def _check_status_many(values, target, min_int):
+    """
+    Apply _check_status to every item of values and return the results as a list of bools.
+
+    Status columns usually repeat a handful of strings, so _check_status runs only once per distinct str per call. Only exact str instances are memoized: 1, 1.0 and True hash alike but do not share a result. Exact ints are compared inline; every other type goes through _check_status.
+    """
+    string_hits = {}
+    results = []
+
+    for value in values:
+        kind = type(value)
+        if kind is str:
+            hit = string_hits.get(value)
+            if hit is None:
+                hit = string_hits[value] = _check_status(value, target, min_int)
+        elif kind is int:
+            hit = value >= min_int
+        else:
+            # bool, subclasses and everything else take the general rule
+            hit = _check_status(value, target, min_int)
+        results.append(hit)
+
+    return results
 
 
 def check_status_A(value):
@@ -118,13 +348,7 @@ def check_status_A(value):
     Returns:
         bool: True when value indicates active status, otherwise False.
     """
-    if value is None:
-        return False
-    if isinstance(value, str) and value.strip().lower() == "active":
-        return True
-    if isinstance(value, int) and value > 0:
-        return True
-    return False
+    return _check_status(value, "active", 1)
 
 def check_status_B(value):
     """
@@ -142,11 +366,30 @@ def check_status_B(value):
     Returns:
         bool: True when the value meets the "B" status condition, otherwise False.
     """
-    if value is None:
-        return False
-    if isinstance(value, str) and value.strip().lower() == "enabled":
-        return True
-    if isinstance(value, int) and value >= 0: # Slight difference here
-        return True
-    return False
+    return _check_status(value, "enabled", 0)
+
+
+def check_status_A_many(values):
+    """
+    Batch version of check_status_A.
+
+    Parameters:
+        values (Iterable): Values to evaluate.
 
+    Returns:
+        list[bool]: check_status_A(value) for each value, in order.
+    """
+    return _check_status_many(values, "active", 1)
+
+
+def check_status_B_many(values):
+    """
+    Batch version of check_status_B.
+
+    Parameters:
+        values (Iterable): Values to evaluate.
+
+    Returns:
+        list[bool]: check_status_B(value) for each value, in order.
+    """
+    return _check_status_many(values, "enabled", 0)
@@ -0,0 +1,27 @@
+import unittest
+
+from complex_utils import calculate_complex_metric, process_and_filter_data
+
+
+class ProcessAndFilterDataTest(unittest.TestCase):
+    def test_multi_char_filter_matches_unreversed_item(self):
+        # '@a' shifts to 'Ab', which contains 'AB' case-insensitively; the
+        # filter must see the item before even-length reversal turns it
+        # into 'bA'.
+        self.assertEqual(process_and_filter_data(['@a'], 'ab'), 'bA')
+
+    def test_multi_char_filter_rejects_reversed_only_match(self):
+        # 'a@' shifts to 'bA'; only its reversal 'Ab' contains 'AB'.
+        self.assertEqual(process_and_filter_data(['a@'], 'ab'), '')
+
+
+class CalculateComplexMetricTest(unittest.TestCase):
+    def test_weighted_sum_is_plain_left_to_right(self):
+        # Compensated summation (sum() of floats from Python 3.12) would
+        # give 10000000000000046 here.
+        values = [1e16, 0.5, 7.0, 3.0, 3.0, 1.0]
+        self.assertEqual(calculate_complex_metric(values), 10000000000000044)
+
+
+if __name__ == '__main__':
+    unittest.main()